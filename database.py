@@ -1,9 +1,44 @@
 import sqlite3
 import gzip
+import pickle
+import numpy as np
+from collections import OrderedDict
 from typing import Optional, Dict, List, Any
 import os
 
 
+# LRU cache of get_school_normalized results keyed by (database file, school name).
+# Cleared by load_school_aliases since it changes the schools table.
+_school_normalized_cache = OrderedDict()
+_SCHOOL_NORMALIZED_CACHE_SIZE = 4096
+
+# Embeddings are stored as unit-length, raw little-endian float32 bytes
+# (previously pickled arrays), so cosine similarity is a plain dot product
+EMBEDDING_DTYPE = np.dtype('<f4')
+
+# PRAGMA user_version history: 1 = raw float32 blobs, 2 = unit-length blobs
+_EMBEDDING_BLOB_VERSION = 2
+
+# External-content FTS5 indexes over the child tables' text columns, used by
+# the 'contains' filters in search.py: (fts table, content table, columns)
+_CHILD_FTS_TABLES = [
+    ('educations_fts', 'educations', ('school_name', 'school_normalized')),
+    ('practices_fts', 'practices', ('practice_type',)),
+    ('industries_fts', 'industries', ('industry',)),
+    ('regions_fts', 'regions', ('region',)),
+    ('languages_fts', 'languages', ('language',)),
+]
+
+
+class _Connection(sqlite3.Connection):
+    """
+    Connection returned by init_database.
+    
+    Unlike a plain sqlite3.Connection it accepts attributes, which lets per-connection
+    facts (such as the resolved database file, see _database_file) be cached on it.
+    """
+
+
 def init_database(db_path: str = 'lawyers.db') -> sqlite3.Connection:
     """
     Initialize SQLite database with schema for lawyers, educations, practices, etc.
@@ -14,9 +49,17 @@ def init_database(db_path: str = 'lawyers.db') -> sqlite3.Connection:
     Returns:
         Database connection
     """
-    conn = sqlite3.connect(db_path)
+    # sqlite3 keeps a per-connection cache of prepared statements keyed by SQL
+    # text; search.py emits a small set of templates, so size it to hold them all
+    conn = sqlite3.connect(db_path, cached_statements=256, factory=_Connection)
     conn.row_factory = sqlite3.Row
     
+    # 64 MiB page cache, in-memory temp b-trees (DISTINCT / ORDER BY), and
+    # memory-mapped reads so large blobs (embeddings) skip the read() copy
+    conn.execute('PRAGMA cache_size = -65536')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    conn.execute('PRAGMA mmap_size = 268435456')
+    
     cursor = conn.cursor()
     
     # Lawyers table - core lawyer information
@@ -116,13 +159,141 @@ def init_database(db_path: str = 'lawyers.db') -> sqlite3.Connection:
         )
     ''')
     
+    # Child-table FTS5 indexes are required by search queries, so build any
+    # that are missing (e.g. databases created before they existed)
+    _create_child_fts(cursor, rebuild=False)
+    
+    # One-time conversion of embeddings stored by older versions
+    cursor.execute('PRAGMA user_version')
+    version = cursor.fetchone()[0]
+    if version < _EMBEDDING_BLOB_VERSION:
+        _migrate_embeddings(cursor, pickled=version < 1)
+        cursor.execute(f'PRAGMA user_version = {_EMBEDDING_BLOB_VERSION}')
+    
     conn.commit()
     return conn
 
 
+def embedding_to_blob(embedding) -> bytes:
+    """
+    Serialize an embedding vector for the experience_embeddings table.
+    
+    The vector is scaled to unit length (zero vectors are kept as-is).
+    
+    Args:
+        embedding: Embedding vector (list or array of floats)
+        
+    Returns:
+        Raw little-endian float32 bytes
+    """
+    vector = np.asarray(embedding, dtype=EMBEDDING_DTYPE)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector = vector / norm
+    return vector.astype(EMBEDDING_DTYPE, copy=False).tobytes()
+
+
+def embedding_from_blob(blob: bytes) -> np.ndarray:
+    """
+    Deserialize an embedding stored by embedding_to_blob.
+    
+    Args:
+        blob: Raw float32 bytes
+        
+    Returns:
+        Read-only float32 array viewing the blob (no copy)
+    """
+    return np.frombuffer(blob, dtype=EMBEDDING_DTYPE)
+
+
+def _migrate_embeddings(cursor: sqlite3.Cursor, pickled: bool):
+    """
+    Rewrite stored embeddings in the current format (unit-length raw float32).
+    
+    Args:
+        cursor: Database cursor
+        pickled: Whether the stored blobs are pickled numpy arrays (user_version 0)
+    """
+    decode = pickle.loads if pickled else embedding_from_blob
+    cursor.execute('SELECT id, embedding FROM experience_embeddings WHERE embedding IS NOT NULL')
+    updates = []
+    for row_id, blob in cursor.fetchall():
+        try:
+            if pickled and blob[:1] != b'\x80':  # pickle protocol 2+ header
+                raise ValueError('not a pickled array')
+            updates.append((embedding_to_blob(decode(blob)), row_id))
+        except Exception:
+            # Unreadable embedding - clear it (it is regenerated with the others)
+            # rather than failing every init_database call
+            updates.append((None, row_id))
+    cursor.executemany('UPDATE experience_embeddings SET embedding = ? WHERE id = ?', updates)
+
+
+def _create_child_fts(cursor: sqlite3.Cursor, rebuild: bool):
+    """
+    Create the child-table FTS5 indexes and the triggers that keep them in sync.
+    
+    The content lives in the child tables themselves (content=/content_rowid=),
+    so the indexes store only tokens and are repopulated with 'rebuild'.
+    
+    Args:
+        cursor: Database cursor
+        rebuild: Drop and rebuild indexes that already exist
+    """
+    fts_names = [fts_table for fts_table, _, _ in _CHILD_FTS_TABLES]
+    placeholders = ', '.join('?' * len(fts_names))
+    existing = {row[0] for row in cursor.execute(
+        f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+        fts_names
+    )}
+    
+    for fts_table, table, columns in _CHILD_FTS_TABLES:
+        if fts_table in existing and not rebuild:
+            continue
+        
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'new.{col}' for col in columns)
+        old_values = ', '.join(f'old.{col}' for col in columns)
+        
+        cursor.execute(f'DROP TRIGGER IF EXISTS {fts_table}_insert')
+        cursor.execute(f'DROP TRIGGER IF EXISTS {fts_table}_update')
+        cursor.execute(f'DROP TRIGGER IF EXISTS {fts_table}_delete')
+        cursor.execute(f'DROP TABLE IF EXISTS {fts_table}')
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE {fts_table} USING fts5(
+                {column_list},
+                content='{table}',
+                content_rowid='id'
+            )
+        ''')
+        cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+        
+        # External-content tables are updated with the special 'delete' command
+        cursor.execute(f'''
+            CREATE TRIGGER {fts_table}_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts_table}(rowid, {column_list})
+                VALUES (new.id, {new_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER {fts_table}_update AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts_table}(rowid, {column_list})
+                VALUES (new.id, {new_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER {fts_table}_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                VALUES ('delete', old.id, {old_values});
+            END
+        ''')
+
+
 def create_indexes(conn: sqlite3.Connection):
     """
-    Create database indexes and FTS5 virtual table for fast lookups.
+    Create database indexes and FTS5 virtual tables for fast lookups.
     
     Args:
         conn: Database connection
@@ -157,6 +328,12 @@ def create_indexes(conn: sqlite3.Connection):
         ON lawyers(title)
     ''')
     
+    # NOCASE collation matches the case-insensitive language filter in search.py
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_languages_language_nocase
+        ON languages(language COLLATE NOCASE)
+    ''')
+    
     cursor.execute('''
         CREATE INDEX IF NOT EXISTS idx_lawyers_name 
         ON lawyers(first_name, last_name)
@@ -214,6 +391,9 @@ def create_indexes(conn: sqlite3.Connection):
         END
     ''')
     
+    # FTS5 indexes for 'contains' filters on the child tables
+    _create_child_fts(cursor, rebuild=True)
+    
     conn.commit()
 
 
@@ -392,6 +572,7 @@ def load_school_aliases(conn: sqlite3.Connection, alias_file: str = 'school_alia
                     ''', (normalized_name, alias))
     
     conn.commit()
+    _school_normalized_cache.clear()
 
 
 def load_practice_aliases(alias_file: str = 'practice_alias.csv') -> Dict[str, str]:
@@ -442,6 +623,9 @@ def get_school_normalized(conn: sqlite3.Connection, school_name: str) -> str:
     """
     Get normalized school name from alias table.
     
+    Results are cached per database file, so repeated lookups of the same school
+    (across AST nodes, searches and education entries) skip the alias queries.
+    
     Args:
         conn: Database connection
         school_name: School name to normalize
@@ -449,6 +633,53 @@ def get_school_normalized(conn: sqlite3.Connection, school_name: str) -> str:
     Returns:
         Normalized school name
     """
+    # Key on the database file rather than the connection: callers open a new
+    # connection per search. In-memory databases ('' file) are not cached.
+    db_file = _database_file(conn)
+    if not db_file:
+        return _lookup_school_normalized(conn, school_name)
+    
+    cache_key = (db_file, school_name)
+    normalized = _school_normalized_cache.get(cache_key)
+    if normalized is not None:
+        _school_normalized_cache.move_to_end(cache_key)
+        return normalized
+    
+    normalized = _lookup_school_normalized(conn, school_name)
+    
+    _school_normalized_cache[cache_key] = normalized
+    if len(_school_normalized_cache) > _SCHOOL_NORMALIZED_CACHE_SIZE:
+        _school_normalized_cache.popitem(last=False)
+    
+    return normalized
+
+
+def _database_file(conn: sqlite3.Connection) -> str:
+    """
+    Get the main database file of a connection ('' for in-memory databases).
+    
+    The PRAGMA is run once per connection and the answer cached on connections
+    from init_database, so cache hits in get_school_normalized need no query.
+    
+    Args:
+        conn: Database connection
+        
+    Returns:
+        Path of the database file
+    """
+    db_file = getattr(conn, 'database_file', None)
+    if db_file is None:
+        db_file = conn.execute('PRAGMA database_list').fetchone()[2]
+        try:
+            conn.database_file = db_file
+        except AttributeError:
+            # Plain sqlite3.Connection (not opened by init_database)
+            pass
+    return db_file
+
+
+def _lookup_school_normalized(conn: sqlite3.Connection, school_name: str) -> str:
+    """Uncached implementation of get_school_normalized()."""
     cursor = conn.cursor()
     
     # Try exact match first
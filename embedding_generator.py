@@ -4,11 +4,10 @@ Module for generating and storing embeddings for lawyer experience sections.
 
 import sqlite3
 import numpy as np
-import pickle
 from typing import List, Tuple, Optional
 from tqdm import tqdm
-from database import init_database
-from scraping_utils import parse_page, parse_text
+from database import init_database, embedding_to_blob, embedding_from_blob
+from scraping_utils import parse_page, parse_pages, parse_text
 from llm_utils import get_embedding, EMBEDDING_MODEL_SMALL
 import re
 
@@ -104,7 +103,7 @@ def store_embedding(conn: sqlite3.Connection, lawyer_id: int,
     cursor = conn.cursor()
 
     # Convert embedding to binary format
-    embedding_blob = pickle.dumps(np.array(embedding, dtype=np.float32))
+    embedding_blob = embedding_to_blob(embedding)
 
     # Delete existing embedding if any
     cursor.execute('DELETE FROM experience_embeddings WHERE lawyer_id = ?', (lawyer_id,))
@@ -149,14 +148,16 @@ def generate_embeddings_for_all_lawyers(db_path: str = 'lawyers.db',
         texts_to_embed = []
         lawyer_data = []
         
-        # Collect experience texts for this batch
-        for lawyer in batch:
-            lawyer_id = lawyer['id']
-            url = lawyer['url']
+        # Collect experience texts for this batch (pages are fetched concurrently)
+        lawyer_ids_by_url = {lawyer['url']: lawyer['id'] for lawyer in batch}
+        for url, raw_html, fetch_error in parse_pages(list(lawyer_ids_by_url)):
+            lawyer_id = lawyer_ids_by_url[url]
 
             try:
-                # Scrape and extract experience
-                raw_html = parse_page(url)
+                if fetch_error:
+                    raise fetch_error
+
+                # Extract experience
                 experience_text = extract_experience_text(raw_html)
 
                 if experience_text:
@@ -214,7 +215,7 @@ def load_embedding(conn: sqlite3.Connection, lawyer_id: int) -> Optional[np.ndar
     
     row = cursor.fetchone()
     if row and row['embedding']:
-        return pickle.loads(row['embedding'])
+        return embedding_from_blob(row['embedding'])
     
     return None
 
@@ -3,7 +3,7 @@ import re
 import sqlite3
 from typing import Dict, List, Optional, Tuple, Any
 from tqdm import tqdm
-from scraping_utils import parse_page, parse_text
+from scraping_utils import parse_pages, parse_text
 from database import init_database, upsert_lawyer, create_indexes, load_school_aliases, get_school_normalized
 from embedding_generator import extract_experience_text, store_embedding
 from llm_utils import get_embedding, EMBEDDING_MODEL_SMALL
@@ -199,19 +199,21 @@ def scrape_and_cache_lawyers(csv_file: str = 'lawyers.csv',
     
     # Process each URL
     processed = 0
-    skipped = 0
     errors = 0
     failed_urls = []
     
-    for url in tqdm(urls, desc="Scraping lawyers"):
-        # Skip if already exists and not forcing rescrape
-        if url in existing_urls and not force_rescrape:
-            skipped += 1
-            continue
-        
+    # Skip if already exists and not forcing rescrape
+    urls_to_scrape = [url for url in urls if force_rescrape or url not in existing_urls]
+    skipped = len(urls) - len(urls_to_scrape)
+    
+    # Pages are fetched concurrently; parsing and DB writes stay on this thread
+    for url, raw_html, fetch_error in tqdm(parse_pages(urls_to_scrape), total=len(urls_to_scrape),
+                                           desc="Scraping lawyers"):
         try:
-            # Scrape and parse
-            raw_html = parse_page(url)
+            if fetch_error:
+                raise fetch_error
+            
+            # Parse
             parsed_data = parse_text(raw_html, url=url)
             
             # Store raw HTML if requested
@@ -1,7 +1,15 @@
+import ahocorasick
+import functools
+import itertools
 import requests
 import re
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Union
+import string
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 # Official Davis Polk practice areas
 VALID_PRACTICES = {
@@ -72,6 +80,123 @@ VALID_REGIONS = {
     'Israel',
 }
 
+# Davis Polk specific title keywords
+# Sorted by length (longest first) to match more specific titles before general ones
+TITLE_KEYWORDS = [
+    'Managing Partner',
+    'Senior Partner',
+    'Senior Counsel',
+    'Of Counsel',
+    'Partner',
+    'Counsel',
+    'Associate',
+    'Co-Head',
+    'Head',
+]
+
+# Common languages to check for explicitly in the Languages section
+LANGUAGE_KEYWORDS = ['English', 'Spanish', 'French', 'German', 'Mandarin', 'Cantonese',
+                     'Japanese', 'Korean', 'Italian', 'Portuguese', 'Russian', 'Arabic',
+                     'Hindi', 'Dutch', 'Swedish', 'Norwegian', 'Hebrew', 'Greek',
+                     'Bosnian', 'Serbian', 'Croatian', 'Serbo-Croatian', 'Turkish', 'Polish',
+                     'Czech', 'Romanian', 'Bulgarian', 'Hungarian', 'Finnish', 'Danish',
+                     'Icelandic', 'Farsi', 'Urdu', 'Bengali', 'Thai', 'Vietnamese',
+                     'Indonesian', 'Malay', 'Tagalog', 'Swahili', 'Afrikaans', 'Zulu',
+                     'Chinese', 'Catalan', 'Basque', 'Gaelic', 'Welsh', 'Albanian',
+                     'Armenian', 'Georgian', 'Ukrainian', 'Belarusian', 'Slovak', 'Slovenian',
+                     'Macedonian', 'Maltese', 'Estonian', 'Latvian', 'Lithuanian']
+
+# Degree and institution markers in the Education section, one scan per line each.
+# No trailing \b: degrees end in '.', which is followed by ',' or a space.
+_DEGREE_RE = re.compile(r'J\.D\.|LL\.M\.|LL\.B\.|B\.A\.|B\.S\.|A\.B\.|M\.A\.|M\.S\.|MBA|Ph\.D\.')
+_INSTITUTION_RE = re.compile(r'University|College|School|Institute')
+
+# Email domain and the characters allowed in the local part before it
+_EMAIL_DOMAIN = '@davispolk.com'
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+
+# Section headers that end each section scanned by parse_text, one alternation per section
+_EDUCATION_STOP_RE = re.compile('Clerkship|Qualification|Experience|Insights|Back to')
+_CLERKSHIP_STOP_RE = re.compile('Qualification|Experience|Education|Back to|Insights')
+_CAPABILITIES_STOP_RE = re.compile('Experience|Education|Insights|Languages|Prior experience|'
+                                   'Clerkship|Qualifications|Back to|Download|Print')
+_LANGUAGES_STOP_RE = re.compile('Experience|Education|Qualifications|Prior experience|Back to')
+
+# Lines in the Clerkship section containing any of these are clerkship entries
+_CLERKSHIP_KEYWORDS = ('Clerk', 'Judge', 'Hon.', 'Court')
+
+# Navigation text (lowercase) skipped when collecting the Capabilities section
+_CAPABILITY_SKIP = ('view', 'see more', 'download', 'print', 'back to', 'address card')
+
+# Precompiled patterns used by parse_text and its helpers
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@davispolk\.com', re.IGNORECASE)
+_PHONE_RES = [
+    re.compile(r'\+1\s*\d{3}\s*\d{3}\s*\d{4}'),  # +1 212 450 4008 format
+    re.compile(r'\+\d[\s\d\-\(\)]+\d'),  # International format
+    re.compile(r'\(\d{3}\)\s*\d{3}[\-\s]\d{4}'),  # (XXX) XXX-XXXX
+    re.compile(r'\d{3}[\-\.\s]\d{3}[\-\.\s]\d{4}'),  # XXX-XXX-XXXX
+]
+_NAME_LINE_RE = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)$')
+_VALID_NAME_RE = re.compile(r'^[A-Z][a-zA-Z\.\s]+$')
+_URL_SLUG_RE = re.compile(r'/lawyers/([a-z0-9\-]+)/?$')
+# A <meta charset> / http-equiv declaration in the document head (bytes input)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+# All languages in one pattern; group i matches LANGUAGE_KEYWORDS[i - 1]. The lookahead makes
+# finditer try every position, so nested names still match (Croatian in Serbo-Croatian).
+_LANGUAGE_RE = re.compile(
+    r'(?=\b(?:' + '|'.join('(' + re.escape(lang) + ')' for lang in LANGUAGE_KEYWORDS) + r')\b)',
+    re.IGNORECASE
+)
+
+# Blacklist of text that should never be considered a name
+NAME_BLACKLIST = {
+    'print this page', 'download address card', 'back to top', 'back to',
+    'lawyers', 'capabilities', 'insights', 'experience', 'education',
+    'languages', 'clerkship', 'qualifications', 'prior experience',
+    'about us', 'offices', 'careers', 'contact', 'search', 'clear',
+    'skip to main content', 'top of page', 'receive insights',
+    'subscribe', 'explore', 'connect', 'legal', 'privacy notice',
+    'cookie policy', 'cookie settings', 'attorney advertising',
+    'prior results do not guarantee', 'davis polk', 'davis polk & wardwell',
+    # Title keywords - these are titles, not names!
+    'managing partner', 'senior partner', 'senior counsel', 'of counsel',
+    'partner', 'counsel', 'associate', 'co-head', 'head',
+    # Office locations (from VALID_OFFICES) - prevent office names from being parsed as names
+    'new york', 'northern california', 'washington dc', 'são paulo',
+    'london', 'brussels', 'madrid', 'hong kong', 'beijing', 'tokyo',
+    # Regions (from VALID_REGIONS)
+    'asia', 'china', 'japan', 'europe', 'latin america', 'israel',
+    # Common honors and achievements - often appear before title
+    'order of the coif', 'magna cum laude', 'summa cum laude', 'cum laude',
+    'phi beta kappa', 'with honors', 'with distinction', 'high honors',
+    # Other non-name items
+    'admitted to practice', 'bar admission', 'law review', 'moot court',
+}
+
+# Shared HTTP session so bulk scrapes reuse keep-alive connections (one TLS handshake
+# per pooled connection instead of one per page); transient connection errors are retried
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+_SESSION.headers.update({'Accept-Encoding': 'gzip, deflate'})
+# (connect, read) timeouts in seconds
+_REQUEST_TIMEOUT = (5, 30)
+
+# All blacklisted phrases as one alternation (longest first)
+_NAME_BLACKLIST_RE = re.compile('|'.join(re.escape(b) for b in sorted(NAME_BLACKLIST, key=len, reverse=True)))
+# Deletes periods (initials) in a single C-level pass
+_DOT_TRANS = str.maketrans('', '', '.')
+
+# LRU cache of parse_text results keyed by (scraped_content, url)
+_PARSED_CACHE = OrderedDict()
+_PARSED_CACHE_SIZE = 256
+
+# Single alternation over all title keywords (longest first, so 'Senior Partner'
+# wins over 'Partner' at the same position) - one scan per line instead of one per keyword
+_TITLE_RE = re.compile('|'.join(sorted(map(re.escape, TITLE_KEYWORDS), key=len, reverse=True)))
+# Keyword priority, used to pick the same title the ordered keyword list would
+_TITLE_PRIORITY = {keyword: i for i, keyword in enumerate(TITLE_KEYWORDS)}
+
 
 def parse_page(url: str) -> str:
     """
@@ -86,31 +211,266 @@ def parse_page(url: str) -> str:
     Raises:
         requests.RequestException: If there's an error fetching the page.
     """
+    return _fetch_page_text(url.strip())
+
+
+@functools.lru_cache(maxsize=1024)
+def _fetch_page_text(url: str) -> str:
+    """Fetch and extract page text; cached per URL (failed fetches are not cached)."""
     try:
-        response = requests.get(url.strip())
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
-        return soup.body.get_text()
+        with _SESSION.get(url, stream=True, timeout=_REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            # Only trust the header encoding if a charset was declared; requests
+            # otherwise defaults text/html to ISO-8859-1
+            content_type = response.headers.get('Content-Type', '')
+            encoding = response.encoding if 'charset' in content_type.lower() else None
+            # Feed the body to lxml as it downloads
+            return html_to_text(response.iter_content(chunk_size=65536), encoding=encoding)
     except requests.RequestException as e:
         raise requests.RequestException(f"Error fetching the page: {e}")
 
-def extract_from_valid_set(text: str, valid_set: set) -> List[str]:
+
+def parse_pages(urls: List[str], max_workers: int = 8) -> Iterator[Tuple[str, Optional[str], Optional[Exception]]]:
     """
-    Extract all items from a valid set that appear in the text.
-    Searches the entire text for exact matches (case-sensitive).
+    Fetch and extract the text of many pages concurrently.
+
+    Fetching is I/O bound, so a thread pool overlaps the network latency of
+    up to max_workers pages while sharing the pooled session.
+
+    Args:
+        urls: The URLs of the web pages to parse
+        max_workers: Maximum number of concurrent fetches
+
+    Yields:
+        (url, text, error) tuples in completion order; if a fetch failed,
+        text is None and error holds the exception
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(parse_page, url): url for url in urls}
+        try:
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    yield url, future.result(), None
+                except Exception as e:
+                    yield url, None, e
+        finally:
+            # Don't start pages nobody will consume if the caller stops early
+            for future in futures:
+                future.cancel()
+
+
+def html_to_text(chunks: Iterable[Union[bytes, str]], encoding: Optional[str] = None) -> str:
+    """
+    Extract the <body> text of an HTML document with a single lxml parse.
+
+    Script, style and template contents are skipped. Parsing stops as soon as
+    </body> is reached, though the remaining chunks are still read so that a
+    streamed response is drained.
+
+    Args:
+        chunks: The document, in one or more pieces (e.g. a streamed response)
+        encoding: Character encoding of byte chunks (e.g. from the Content-Type
+            header). If None, a <meta charset> near the start of the document is
+            honoured, otherwise UTF-8 is assumed rather than lxml's Latin-1 default.
+
+    Returns:
+        The body text of the document
+    """
+    chunks = iter(chunks)
+    first_chunk = next(chunks, b'')
+    if encoding is None and isinstance(first_chunk, bytes) and not _META_CHARSET_RE.search(first_chunk[:1024]):
+        encoding = 'utf-8'
+
+    # recover=True keeps malformed pages from raising
+    parser = etree.HTMLPullParser(events=('start', 'end'), recover=True, huge_tree=False,
+                                  remove_comments=True, remove_pis=True, encoding=encoding)
+    extractor = _BodyTextExtractor()
+    done = False
+    for chunk in itertools.chain([first_chunk], chunks):
+        if done:
+            # </body> reached - the rest is not parsed, but keep reading so a
+            # streamed response is fully consumed and its connection is reused
+            continue
+        parser.feed(chunk)
+        done = extractor.consume(parser.read_events())
+    parser.close()
+    if not done:
+        extractor.consume(parser.read_events())
+    return extractor.text()
+
+
+class _BodyTextExtractor:
+    """
+    Incrementally collect <body> text from HTMLPullParser start/end events.
+
+    Text is emitted in document order as soon as it is known, and finished
+    elements are cleared so the full DOM is never resident. An element's .text
+    is known at its first child's start (or its own end), and its .tail at the
+    next sibling's start (or its parent's end).
+    """
+
+    # Elements whose contents are not page text
+    SKIP_TAGS = frozenset({'script', 'style', 'template'})
+
+    def __init__(self):
+        self.chunks = []
+        self.in_body = False
+        self.done = False
+        self.skip_depth = 0
+        self.pending_tail = None  # Finished element whose tail is not emitted yet
+
+    def _emit(self, text: Optional[str]) -> None:
+        if text and not self.skip_depth:
+            self.chunks.append(text)
+
+    def _flush_tail(self) -> bool:
+        """Emit the pending tail; returns False if there was none."""
+        if self.pending_tail is None:
+            return False
+        self._emit(self.pending_tail.tail)
+        self.pending_tail = None
+        return True
+
+    def consume(self, events) -> bool:
+        """Process parser events; returns True once </body> has been seen."""
+        for event, elem in events:
+            if self.done:
+                break
+            if not self.in_body:
+                if event == 'start' and elem.tag == 'body':
+                    self.in_body = True
+                continue
+
+            if event == 'start':
+                if not self._flush_tail():
+                    # First child - the parent's leading text comes first
+                    self._emit(elem.getparent().text)
+                if elem.tag in self.SKIP_TAGS:
+                    self.skip_depth += 1
+            else:
+                if not self._flush_tail():
+                    # No children - the element's own text
+                    self._emit(elem.text)
+                if elem.tag in self.SKIP_TAGS:
+                    self.skip_depth -= 1
+                if elem.tag == 'body':
+                    self.done = True
+                    break
+                elem.clear(keep_tail=True)
+                self.pending_tail = elem
+        return self.done
+
+    def text(self) -> str:
+        self._flush_tail()
+        return ''.join(self.chunks)
+
+
+def build_automaton(valid_set: set) -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton that matches every item of a valid set.
 
     Args:
-        text: The text to search
         valid_set: Set of valid values to look for
 
     Returns:
-        List of found values
+        Automaton whose matches yield the matched value
     """
-    found = []
+    automaton = ahocorasick.Automaton()
     for item in valid_set:
-        if item in text:
-            found.append(item)
-    return found
+        automaton.add_word(item, item)
+    automaton.make_automaton()
+    return automaton
+
+
+def extract_from_valid_set(text: str, automaton: ahocorasick.Automaton) -> List[str]:
+    """
+    Extract all items from a valid set that appear in the text.
+    Searches the entire text for exact matches (case-sensitive) in a single pass,
+    including overlapping ones (e.g. both 'Litigation' and 'IP Litigation').
+
+    Args:
+        text: The text to search
+        automaton: Automaton built from the valid set with build_automaton()
+
+    Returns:
+        List of found values, in order of first appearance
+    """
+    return list(dict.fromkeys(item for _, item in automaton.iter(text)))
+
+
+# One automaton per valid set, so each set is matched in a single pass over the page
+_PRACTICE_AC = build_automaton(VALID_PRACTICES)
+_INDUSTRY_AC = build_automaton(VALID_INDUSTRIES)
+_OFFICE_AC = build_automaton(VALID_OFFICES)
+_REGION_AC = build_automaton(VALID_REGIONS)
+
+
+def extract_email(text: str) -> Optional[str]:
+    """
+    Extract the first Davis Polk email address from the text.
+
+    Finds the fixed '@davispolk.com' suffix with str.find and walks backwards
+    over the local part, which avoids running a regex over the whole page.
+
+    Args:
+        text: The text to search
+
+    Returns:
+        Lowercased email address, or None if not found
+    """
+    idx = text.find(_EMAIL_DOMAIN)
+    while idx != -1:
+        start = idx
+        while start > 0 and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        # Require a non-empty local part
+        if start < idx:
+            return text[start:idx + len(_EMAIL_DOMAIN)].lower()
+        idx = text.find(_EMAIL_DOMAIN, idx + 1)
+    return None
+
+
+def is_valid_name(name: str) -> bool:
+    """
+    Check if a string is a valid lawyer name.
+
+    Args:
+        name: Candidate name text (usually a single profile line)
+
+    Returns:
+        True if the text looks like a person's name
+    """
+    if not name:
+        return False
+
+    name_lower = name.lower().strip()
+
+    # Check if it is or contains any blacklisted phrase
+    if _NAME_BLACKLIST_RE.search(name_lower):
+        return False
+
+    # Must be proper name format: First Last or First Middle Last
+    # Should start with capital letter, contain letters, spaces, periods (for initials);
+    # this also rules out special characters such as @ + ( ) / : ; = ?
+    if not _VALID_NAME_RE.match(name):
+        return False
+
+    # Should not be too short or too long
+    if len(name) < 3 or len(name) > 50:
+        return False
+
+    # Should have at least 2 words (first and last name)
+    words = name.split()
+    if len(words) < 2:
+        return False
+
+    # Each word should be at least 2 characters (except single-letter middle initials)
+    for word in words:
+        if len(word) > 1 and not word.translate(_DOT_TRANS).isalpha():
+            return False
+
+    return True
 
 
 def extract_name_from_url(url: str) -> Optional[str]:
@@ -134,7 +494,7 @@ def extract_name_from_url(url: str) -> Optional[str]:
         return None
 
     # Extract the slug from the URL (last part after /lawyers/)
-    match = re.search(r'/lawyers/([a-z0-9\-]+)/?$', url.lower())
+    match = _URL_SLUG_RE.search(url.lower())
     if not match:
         return None
 
@@ -192,6 +552,28 @@ def parse_text(scraped_content: str, url: Optional[str] = None) -> Dict[str, Uni
         - clerkship: Clerkship information if available
         - language: Languages spoken (if mentioned)
     """
+    cache_key = (scraped_content, url)
+    cached = _PARSED_CACHE.get(cache_key)
+    if cached is not None:
+        _PARSED_CACHE.move_to_end(cache_key)
+        return _copy_result(cached)
+
+    result = _parse_text(scraped_content, url)
+
+    _PARSED_CACHE[cache_key] = result
+    if len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+        _PARSED_CACHE.popitem(last=False)
+
+    return _copy_result(result)
+
+
+def _copy_result(result: Dict) -> Dict:
+    """Copy a cached parse_text result (and its list values) so callers can't mutate the cache."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+
+
+def _parse_text(scraped_content: str, url: Optional[str] = None) -> Dict[str, Union[str, List[str], None]]:
+    """Uncached implementation of parse_text()."""
     
     # Initialize result dictionary with None values
     result = {
@@ -211,97 +593,17 @@ def parse_text(scraped_content: str, url: Optional[str] = None) -> Dict[str, Uni
     # Clean the content
     content = scraped_content.strip()
     
-    # Try to parse as HTML first, if that fails, treat as plain text
-    try:
-        soup = BeautifulSoup(content, 'html.parser')
-        text_content = soup.get_text()
-    except:
+    # parse_page already returns extracted text, so only markup needs parsing
+    # (with the same lxml extraction parse_page uses)
+    if content.startswith('<'):
+        text_content = html_to_text([content])
+    else:
         text_content = content
     
     # Split into lines for line-by-line processing
     lines = text_content.split('\n')
     cleaned_lines = [line.strip() for line in lines if line.strip()]
     
-    # Davis Polk specific title keywords
-    # Sorted by length (longest first) to match more specific titles before general ones
-    title_keywords = [
-        'Managing Partner',
-        'Senior Partner',
-        'Senior Counsel',
-        'Of Counsel',
-        'Partner',
-        'Counsel',
-        'Associate',
-        'Co-Head',
-        'Head',
-    ]
-    
-    # Blacklist of text that should never be considered a name
-    name_blacklist = {
-        'print this page', 'download address card', 'back to top', 'back to',
-        'lawyers', 'capabilities', 'insights', 'experience', 'education',
-        'languages', 'clerkship', 'qualifications', 'prior experience',
-        'about us', 'offices', 'careers', 'contact', 'search', 'clear',
-        'skip to main content', 'top of page', 'receive insights',
-        'subscribe', 'explore', 'connect', 'legal', 'privacy notice',
-        'cookie policy', 'cookie settings', 'attorney advertising',
-        'prior results do not guarantee', 'davis polk', 'davis polk & wardwell',
-        # Title keywords - these are titles, not names!
-        'managing partner', 'senior partner', 'senior counsel', 'of counsel',
-        'partner', 'counsel', 'associate', 'co-head', 'head',
-        # Office locations (from VALID_OFFICES) - prevent office names from being parsed as names
-        'new york', 'northern california', 'washington dc', 'são paulo',
-        'london', 'brussels', 'madrid', 'hong kong', 'beijing', 'tokyo',
-        # Regions (from VALID_REGIONS)
-        'asia', 'china', 'japan', 'europe', 'latin america', 'israel',
-        # Common honors and achievements - often appear before title
-        'order of the coif', 'magna cum laude', 'summa cum laude', 'cum laude',
-        'phi beta kappa', 'with honors', 'with distinction', 'high honors',
-        # Other non-name items
-        'admitted to practice', 'bar admission', 'law review', 'moot court',
-    }
-    
-    def is_valid_name(name: str) -> bool:
-        """Check if a string is a valid lawyer name."""
-        if not name:
-            return False
-        
-        name_lower = name.lower().strip()
-        
-        # Check blacklist
-        if name_lower in name_blacklist:
-            return False
-        
-        # Check if it contains any blacklisted phrases
-        for blacklisted in name_blacklist:
-            if blacklisted in name_lower:
-                return False
-        
-        # Must be proper name format: First Last or First Middle Last
-        # Should start with capital letter, contain letters, spaces, periods (for initials)
-        if not re.match(r'^[A-Z][a-zA-Z\.\s]+$', name):
-            return False
-        
-        # Should not be too short or too long
-        if len(name) < 3 or len(name) > 50:
-            return False
-        
-        # Should not contain special characters that indicate it's not a name
-        if any(char in name for char in ['@', '+', '(', ')', '/', ':', ';', '=', '?']):
-            return False
-        
-        # Should have at least 2 words (first and last name)
-        words = name.split()
-        if len(words) < 2:
-            return False
-        
-        # Each word should be at least 2 characters (except single-letter middle initials)
-        for word in words:
-            if len(word) > 1 and not word.replace('.', '').isalpha():
-                return False
-        
-        return True
-    
     # Parse Name - Use multiple strategies in order of reliability
     # Strategy 0 (MOST RELIABLE): Extract from URL
     # Davis Polk URLs follow pattern: /lawyers/robert-fiske-jr
@@ -311,9 +613,8 @@ def parse_text(scraped_content: str, url: Optional[str] = None) -> Dict[str, Uni
 
     # Strategy 1: Find name near email
     if not result['name']:
-        email_pattern = r'[a-zA-Z0-9._%+-]+@davispolk\.com'
         for i, line in enumerate(cleaned_lines):
-            if re.search(email_pattern, line, re.IGNORECASE):
+            if _EMAIL_RE.search(line):
                 # Check lines before email (name is usually above email)
                 for j in range(max(0, i-5), i):
                     if is_valid_name(cleaned_lines[j]):
@@ -324,9 +625,8 @@ def parse_text(scraped_content: str, url: Optional[str] = None) -> Dict[str, Uni
 
     # Strategy 2: Try pattern matching in first 30 lines
     if not result['name']:
-        name_pattern = r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)'
         for line in cleaned_lines[:30]:
-            name_match = re.search(r'^' + name_pattern + r'$', line)
+            name_match = _NAME_LINE_RE.search(line)
             if name_match:
                 potential_name = name_match.group(1).strip()
                 if is_valid_name(potential_name):
@@ -337,7 +637,7 @@ def parse_text(scraped_content: str, url: Optional[str] = None) -> Dict[str, Uni
     # This is last resort because it often captures honors/locations instead of names
     if not result['name']:
         for i, line in enumerate(cleaned_lines):
-            if line in title_keywords or any(keyword in line for keyword in title_keywords):
+            if _TITLE_RE.search(line):
                 # Check previous lines for name
                 if i > 0:
                     potential_name = cleaned_lines[i-1]
@@ -346,161 +646,113 @@ def parse_text(scraped_content: str, url: Optional[str] = None) -> Dict[str, Uni
                         break
 
     # Parse Title (independent of name parsing)
-    for i, line in enumerate(cleaned_lines):
-        if line in title_keywords or any(keyword in line for keyword in title_keywords):
-            if not result['title']:
-                for keyword in title_keywords:
-                    if keyword in line:
-                        result['title'] = keyword
-                        break
+    for line in cleaned_lines:
+        titles_found = _TITLE_RE.findall(line)
+        if titles_found:
+            result['title'] = min(titles_found, key=_TITLE_PRIORITY.__getitem__)
+            break
     
     # Parse Email
-    email_pattern = r'[a-zA-Z0-9._%+-]+@davispolk\.com'
-    email_match = re.search(email_pattern, text_content)
-    if email_match:
-        result['email'] = email_match.group(0).lower()
+    result['email'] = extract_email(text_content)
     
     # Parse Phone Number
-    phone_patterns = [
-        r'\+1\s*\d{3}\s*\d{3}\s*\d{4}',  # +1 212 450 4008 format
-        r'\+\d[\s\d\-\(\)]+\d',  # International format
-        r'\(\d{3}\)\s*\d{3}[\-\s]\d{4}',  # (XXX) XXX-XXXX
-        r'\d{3}[\-\.\s]\d{3}[\-\.\s]\d{4}',  # XXX-XXX-XXXX
-    ]
-    
-    for pattern in phone_patterns:
-        phone_match = re.search(pattern, text_content)
+    for phone_re in _PHONE_RES:
+        phone_match = phone_re.search(text_content)
         if phone_match:
             result['phone'] = phone_match.group(0).strip()
             break
     
-    # Parse Office Location - Search entire page for exact matches
-    for office in VALID_OFFICES:
-        if office in text_content:
-            result['office_location'] = office
-            break
+    # Parse Office Location - Search entire page for exact matches (first one found)
+    for _, office in _OFFICE_AC.iter(text_content):
+        result['office_location'] = office
+        break
     
     # Parse Practice Areas - Search entire page for exact matches from valid set
-    result['practice_type'] = extract_from_valid_set(text_content, VALID_PRACTICES)
+    result['practice_type'] = extract_from_valid_set(text_content, _PRACTICE_AC)
 
     # Parse Industries - Search entire page for exact matches from valid set
-    result['industry'] = extract_from_valid_set(text_content, VALID_INDUSTRIES)
+    result['industry'] = extract_from_valid_set(text_content, _INDUSTRY_AC)
+
+    # Parse Education, Clerkship, Capabilities (regions) and Languages sections in one pass.
+    # Each section keeps its own flag since sections can overlap (e.g. an 'Education'
+    # line both ends Capabilities and starts Education).
+    # Schools and languages are collected in dicts used as insertion-ordered sets
+    schools = {}
+    clerkships = []
+    append_clerkship = clerkships.append
+    capabilities_text = []
+    append_capability = capabilities_text.append
+    languages = {}
 
-    # Parse Education/School
     education_section = False
-    for i, line in enumerate(cleaned_lines):
+    clerkship_section = False
+    clerkship_done = False
+    in_capabilities = False
+    languages_section = False
+
+    for line in cleaned_lines:
+        # Education/School
         if 'Education' in line:
             education_section = True
-            continue
-        
-        if education_section:
+        elif education_section:
             # Stop at next section
-            if any(section in line for section in ['Clerkship', 'Qualification', 'Experience', 
-                                                   'Insights', 'Back to']):
+            if _EDUCATION_STOP_RE.search(line):
                 education_section = False
-                continue
-            
             # Extract degrees and schools
-            if 'J.D.' in line or 'LL.M.' in line or 'LL.B.' in line:
-                result['school'].append(line)
-            elif 'B.A.' in line or 'B.S.' in line or 'A.B.' in line:
-                result['school'].append(line)
-            elif 'M.A.' in line or 'M.S.' in line or 'MBA' in line or 'Ph.D.' in line:
-                result['school'].append(line)
+            elif _DEGREE_RE.search(line):
+                schools[line] = None
             # Also capture lines with University/College/School
-            elif any(edu in line for edu in ['University', 'College', 'School', 'Institute']):
-                if len(line) < 100:  # Reasonable length
-                    result['school'].append(line)
-    
-    # Parse Clerkship
-    clerkship_section = False
-    for i, line in enumerate(cleaned_lines):
-        if 'Clerkship' in line:
-            clerkship_section = True
-            continue
-        
-        if clerkship_section:
-            # Stop at next section
-            if any(section in line for section in ['Qualification', 'Experience', 'Education',
-                                                   'Back to', 'Insights']):
-                break
-            
-            # Capture clerkship info
-            if any(keyword in line for keyword in ['Clerk', 'Judge', 'Hon.', 'Court']):
-                if not result['clerkship']:
-                    result['clerkship'] = line
-                else:
-                    result['clerkship'] += ', ' + line
-    
-    # Parse Region - Only from Capabilities section (exact matches from VALID_REGIONS)
-    in_capabilities = False
-    capabilities_text = []
-
-    for i, line in enumerate(cleaned_lines):
+            elif len(line) < 100 and _INSTITUTION_RE.search(line):  # Reasonable length
+                schools[line] = None
+
+        # Clerkship (only the first Clerkship section is read)
+        if not clerkship_done:
+            if 'Clerkship' in line:
+                clerkship_section = True
+            elif clerkship_section:
+                # Stop at next section
+                if _CLERKSHIP_STOP_RE.search(line):
+                    clerkship_done = True
+                # Capture clerkship info
+                elif any(keyword in line for keyword in _CLERKSHIP_KEYWORDS):
+                    append_clerkship(line)
+
+        # Capabilities - collected for region extraction
         if 'Capabilities' in line:
             in_capabilities = True
-            continue
-
-        # Stop at next major section
-        if in_capabilities and any(section in line for section in
-                                   ['Experience', 'Education', 'Insights', 'Languages',
-                                    'Prior experience', 'Clerkship', 'Qualifications',
-                                    'Back to', 'Download', 'Print']):
-            if 'Capabilities' not in line:
+        elif in_capabilities:
+            # Stop at next major section
+            if _CAPABILITIES_STOP_RE.search(line):
                 in_capabilities = False
-                continue
+            else:
+                line_lower = line.lower()
+                if not any(skip in line_lower for skip in _CAPABILITY_SKIP):
+                    append_capability(line)
 
-        # Collect capabilities section text
-        if in_capabilities and line:
-            if not any(skip in line.lower() for skip in
-                      ['view', 'see more', 'download', 'print', 'back to', 'address card']):
-                capabilities_text.append(line)
-
-    # Extract regions from capabilities section only
+        # Languages (less common in Davis Polk profiles but included for completeness)
+        if 'Language' in line:
+            languages_section = True
+        elif languages_section:
+            # Stop at next major section
+            if _LANGUAGES_STOP_RE.search(line):
+                languages_section = False
+            else:
+                # Languages in the line (case-insensitive, word boundary), in keyword order
+                for index in sorted({m.lastindex for m in _LANGUAGE_RE.finditer(line)}):
+                    languages[LANGUAGE_KEYWORDS[index - 1]] = None
+
+    if clerkships:
+        result['clerkship'] = ', '.join(clerkships)
+
+    # Extract regions from capabilities section only (exact matches from VALID_REGIONS)
     if capabilities_text:
         capabilities_content = '\n'.join(capabilities_text)
-        regions_found = extract_from_valid_set(capabilities_content, VALID_REGIONS)
+        regions_found = extract_from_valid_set(capabilities_content, _REGION_AC)
         if regions_found:
             result['region'] = regions_found
-    
-    # Parse Languages (less common in Davis Polk profiles but included for completeness)
-    # Common languages to check for explicitly
-    language_keywords = ['English', 'Spanish', 'French', 'German', 'Mandarin', 'Cantonese',
-                        'Japanese', 'Korean', 'Italian', 'Portuguese', 'Russian', 'Arabic',
-                        'Hindi', 'Dutch', 'Swedish', 'Norwegian', 'Hebrew', 'Greek',
-                        'Bosnian', 'Serbian', 'Croatian', 'Serbo-Croatian', 'Turkish', 'Polish',
-                        'Czech', 'Romanian', 'Bulgarian', 'Hungarian', 'Finnish', 'Danish',
-                        'Icelandic', 'Farsi', 'Urdu', 'Bengali', 'Thai', 'Vietnamese',
-                        'Indonesian', 'Malay', 'Tagalog', 'Swahili', 'Afrikaans', 'Zulu',
-                        'Chinese', 'Catalan', 'Basque', 'Gaelic', 'Welsh', 'Albanian',
-                        'Armenian', 'Georgian', 'Ukrainian', 'Belarusian', 'Slovak', 'Slovenian',
-                        'Macedonian', 'Maltese', 'Estonian', 'Latvian', 'Lithuanian']
-    
-    # Look for Languages section - only extract languages from this section
-    languages_section = False
-    
-    for i, line in enumerate(cleaned_lines):
-        # Check if we're in a Languages section
-        if 'Language' in line:
-            languages_section = True
-            continue
-            
-        # Stop at next major section
-        if languages_section and any(section in line for section in 
-                                    ['Experience', 'Education', 'Qualifications', 
-                                     'Prior experience', 'Back to']):
-            languages_section = False
-            
-        # Only extract languages if we're in the Languages section
-        if languages_section:
-            for lang in language_keywords:
-                # Check if language appears in line (case-insensitive, word boundary)
-                pattern = r'\b' + re.escape(lang) + r'\b'
-                if re.search(pattern, line, re.IGNORECASE):
-                    result['language'].append(lang)
-    
-    # Remove duplicates from languages
-    result['language'] = list(set(result['language']))
+
+    result['school'] = list(schools)
+    result['language'] = list(languages)
     
     # Clean up empty lists - convert to None
     for key in ['practice_type', 'school', 'language']:
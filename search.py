@@ -1,8 +1,60 @@
+import functools
+import re
 import sqlite3
 from typing import List, Dict, Any, Optional, Tuple
 from database import get_school_normalized
 
 
+# Default query for an empty AST: return all lawyers
+_EMPTY_QUERY_SQL = "SELECT l.id, l.name, l.url FROM lawyers l"
+
+# A letter or digit: values without one have no FTS5 tokens (e.g. "", "-", "&")
+_FTS_TOKEN_RE = re.compile(r'[^\W_]')
+
+# LEFT JOIN clause for each child table, in the order they are emitted
+_JOIN_CLAUSES = [
+    ('educations', "LEFT JOIN educations e ON l.id = e.lawyer_id"),
+    ('practices', "LEFT JOIN practices p ON l.id = p.lawyer_id"),
+    ('industries', "LEFT JOIN industries ind ON l.id = ind.lawyer_id"),
+    ('regions', "LEFT JOIN regions r ON l.id = r.lawyer_id"),
+    ('languages', "LEFT JOIN languages lang ON l.id = lang.lawyer_id"),
+]
+
+
+def _fts_prefix_phrase(value: Any) -> str:
+    """
+    Quote a value as an FTS5 prefix phrase for 'contains' matching.
+    
+    The value's words must appear consecutively, and the last one may be a
+    prefix ("span" matches "Spanish", "capital mark" matches "Capital Markets").
+    Quoting keeps FTS5 operators and punctuation (e.g. "M&A") from being parsed.
+    
+    Args:
+        value: Raw filter value
+        
+    Returns:
+        FTS5 query string
+    """
+    return '"' + str(value).replace('"', '""') + '"*'
+
+
+def _has_fts_tokens(value: Any) -> bool:
+    """
+    Check whether a 'contains' value has any words for FTS5 to match.
+    
+    Values without tokens would match nothing as an FTS5 phrase, so callers fall
+    back to LIKE '%value%' (which, like before FTS5, matches any non-NULL value
+    for an empty string).
+    
+    Args:
+        value: Raw filter value
+        
+    Returns:
+        True if the value contains a letter or digit
+    """
+    return bool(_FTS_TOKEN_RE.search(str(value)))
+
+
 def handle_temporal_query(ast_node: Dict[str, Any], default_field: str = 'law_school_year') -> Dict[str, Any]:
     """
     Handle temporal queries and determine which year field to use.
@@ -27,6 +79,139 @@ def handle_temporal_query(ast_node: Dict[str, Any], default_field: str = 'law_sc
     return ast_node
 
 
+def _compile_name(node: Dict[str, Any], conn: sqlite3.Connection, joins: set,
+                  fts_joins: set, params: List[Any]) -> Optional[str]:
+    """Name queries - use FTS5 for whole-word matching."""
+    op, value = node.get('op'), node.get('value')
+    fts_joins.add('lawyers_fts')
+    # Split value into words for proper FTS5 matching
+    name_words = str(value).strip().split()
+    
+    if op == 'contains':
+        # Use FTS5 MATCH for whole-word matching
+        # FTS5 matches whole words by default, so "alon" won't match "Malone"
+        # Join words with AND for multi-word names (all words must match)
+        params.append(' '.join(name_words))
+        return "fts.full_name MATCH ?"
+    if op == 'eq':
+        # Exact match - use phrase match in FTS5
+        params.append('"' + str(value) + '"')
+        return "fts.full_name MATCH ?"
+    return None
+
+
+def _compile_title(node: Dict[str, Any], conn: sqlite3.Connection, joins: set,
+                   fts_joins: set, params: List[Any]) -> Optional[str]:
+    """Title queries."""
+    op, value = node.get('op'), node.get('value')
+    if op == 'eq':
+        params.append(value)
+        return "l.title = ?"
+    if op == 'contains':
+        if not _has_fts_tokens(value):
+            params.append(f"%{value}%")
+            return "l.title LIKE ?"
+        params.append(_fts_prefix_phrase(value))
+        return "l.id IN (SELECT rowid FROM lawyers_fts WHERE title MATCH ?)"
+    return None
+
+
+def _compile_school(node: Dict[str, Any], conn: sqlite3.Connection, joins: set,
+                    fts_joins: set, params: List[Any]) -> Optional[str]:
+    """School queries, matched on both the raw and the normalized school name."""
+    op, value = node.get('op'), node.get('value')
+    joins.add('educations')
+    # Normalize school name
+    normalized = get_school_normalized(conn, str(value))
+    if op == 'contains':
+        if not _has_fts_tokens(value):
+            params.append(f"%{value}%")
+            params.append(f"%{normalized}%")
+            return "(e.school_name LIKE ? OR e.school_normalized LIKE ?)"
+        params.append(
+            f"school_name : {_fts_prefix_phrase(value)} OR "
+            f"school_normalized : {_fts_prefix_phrase(normalized)}"
+        )
+        return "e.id IN (SELECT rowid FROM educations_fts WHERE educations_fts MATCH ?)"
+    if op == 'eq':
+        params.append(value)
+        params.append(normalized)
+        return "(e.school_name = ? OR e.school_normalized = ?)"
+    return None
+
+
+# Comparison operator for each temporal op
+_YEAR_COMPARISONS = {'gt': '>', 'lt': '<', 'gte': '>=', 'lte': '<=', 'eq': '='}
+
+
+def _compile_year(node: Dict[str, Any], conn: sqlite3.Connection, joins: set,
+                  fts_joins: set, params: List[Any]) -> Optional[str]:
+    """Temporal queries (graduation year)."""
+    joins.add('educations')
+    node = handle_temporal_query(node, 'law_school_year')
+    comparison = _YEAR_COMPARISONS.get(node.get('op'))
+    if comparison is None:
+        return None
+    params.append(node.get('value'))
+    return f"e.year {comparison} ? AND e.is_law_degree = 1"
+
+
+def _child_field_compiler(table: str, alias: str, column: str, fts_table: str, eq_condition: str):
+    """
+    Build the compiler for a child-table field with 'eq' and FTS5 'contains' ops.
+    
+    Args:
+        table: Child table to LEFT JOIN
+        alias: Table alias used in the SQL
+        column: Qualified text column, for the LIKE fallback on token-less values
+        fts_table: FTS5 index over the child table
+        eq_condition: Condition for 'eq'
+        
+    Returns:
+        Field compiler function
+    """
+    contains_condition = f"{alias}.id IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH ?)"
+    like_condition = f"{column} LIKE ?"
+    
+    def compile_field(node: Dict[str, Any], conn: sqlite3.Connection, joins: set,
+                      fts_joins: set, params: List[Any]) -> Optional[str]:
+        op, value = node.get('op'), node.get('value')
+        joins.add(table)
+        if op == 'eq':
+            params.append(value)
+            return eq_condition
+        if op == 'contains':
+            if not _has_fts_tokens(value):
+                params.append(f"%{value}%")
+                return like_condition
+            params.append(_fts_prefix_phrase(value))
+            return contains_condition
+        return None
+    
+    return compile_field
+
+
+# Compiler for each AST field: (node, conn, joins, fts_joins, params) -> condition or None.
+# Compilers register the joins they need and append their parameters.
+_FIELD_COMPILERS = {
+    'name': _compile_name,
+    'title': _compile_title,
+    'school': _compile_school,
+    'law_school_year': _compile_year,
+    'undergrad_year': _compile_year,
+    'graduated': _compile_year,
+    'practice': _child_field_compiler('practices', 'p', 'p.practice_type', 'practices_fts',
+                                      "p.practice_type = ?"),
+    'industry': _child_field_compiler('industries', 'ind', 'ind.industry', 'industries_fts',
+                                      "ind.industry = ?"),
+    'region': _child_field_compiler('regions', 'r', 'r.region', 'regions_fts',
+                                    "r.region = ?"),
+    # Case-insensitive via collation, so idx_languages_language_nocase can be used
+    'language': _child_field_compiler('languages', 'lang', 'lang.language', 'languages_fts',
+                                      "lang.language = ? COLLATE NOCASE"),
+}
+
+
 def compile_ast_to_sql(ast: List[Dict[str, Any]], conn: sqlite3.Connection) -> Tuple[str, List[Any]]:
     """
     Compile AST to parameterized SQL query.
@@ -39,8 +224,7 @@ def compile_ast_to_sql(ast: List[Dict[str, Any]], conn: sqlite3.Connection) -> T
         Tuple of (SQL query string, parameter list)
     """
     if not ast:
-        # Default query: return all lawyers
-        return "SELECT DISTINCT l.id, l.name, l.url FROM lawyers l", []
+        return _EMPTY_QUERY_SQL, []
     
     # Build WHERE clause
     where_parts = []
@@ -49,166 +233,67 @@ def compile_ast_to_sql(ast: List[Dict[str, Any]], conn: sqlite3.Connection) -> T
     fts_joins = set()  # Track FTS5 joins separately
     is_first_condition = True
     
-    i = 0
-    while i < len(ast):
-        node = ast[i]
+    for node in ast:
+        op = node.get('op')
         
         # Handle boolean operators
-        if node.get('op') in ['AND', 'OR', 'NOT']:
-            if node['op'] == 'AND':
-                where_parts.append('AND')
-            elif node['op'] == 'OR':
-                where_parts.append('OR')
-            elif node['op'] == 'NOT':
-                where_parts.append('NOT')
-            i += 1
+        if op in ('AND', 'OR', 'NOT'):
+            where_parts.append(op)
             is_first_condition = False
             continue
         
         # Handle field queries
         field = node.get('field')
-        op = node.get('op')
-        value = node.get('value')
-        
         if not field or not op:
-            i += 1
             continue
         
-        condition = None
-        
-        # Name queries - use FTS5 for whole-word matching
-        if field == 'name':
-            fts_joins.add('lawyers_fts')
-            # Split value into words for proper FTS5 matching
-            name_words = str(value).strip().split()
-            
-            if op == 'contains':
-                # Use FTS5 MATCH for whole-word matching
-                # FTS5 matches whole words by default, so "alon" won't match "Malone"
-                # Join words with AND for multi-word names (all words must match)
-                fts_query = ' '.join(name_words)
-                condition = "fts.full_name MATCH ?"
-                params.append(fts_query)
-            elif op == 'eq':
-                # Exact match - use phrase match in FTS5
-                fts_query = '"' + str(value) + '"'
-                condition = "fts.full_name MATCH ?"
-                params.append(fts_query)
-        
-        # Title queries
-        elif field == 'title':
-            if op == 'eq':
-                condition = "l.title = ?"
-                params.append(value)
-            elif op == 'contains':
-                condition = "l.title LIKE ?"
-                params.append(f"%{value}%")
-        
-        # School queries
-        elif field == 'school':
-            joins.add('educations')
-            # Normalize school name
-            normalized = get_school_normalized(conn, str(value))
-            if op == 'contains':
-                condition = "(e.school_name LIKE ? OR e.school_normalized LIKE ?)"
-                params.append(f"%{value}%")
-                params.append(f"%{normalized}%")
-            elif op == 'eq':
-                condition = "(e.school_name = ? OR e.school_normalized = ?)"
-                params.append(value)
-                params.append(normalized)
-        
-        # Temporal queries (graduation year)
-        elif field in ['law_school_year', 'undergrad_year', 'graduated']:
-            joins.add('educations')
-            node = handle_temporal_query(node, 'law_school_year')
-            year_field = 'law_school_year' if 'law' in node.get('field', '') else 'undergrad_year'
-            
-            if op == 'gt':
-                condition = "e.year > ? AND e.is_law_degree = 1"
-                params.append(value)
-            elif op == 'lt':
-                condition = "e.year < ? AND e.is_law_degree = 1"
-                params.append(value)
-            elif op == 'gte':
-                condition = "e.year >= ? AND e.is_law_degree = 1"
-                params.append(value)
-            elif op == 'lte':
-                condition = "e.year <= ? AND e.is_law_degree = 1"
-                params.append(value)
-            elif op == 'eq':
-                condition = "e.year = ? AND e.is_law_degree = 1"
-                params.append(value)
-        
-        # Practice queries
-        elif field == 'practice':
-            joins.add('practices')
-            if op == 'eq':
-                condition = "p.practice_type = ?"
-                params.append(value)
-            elif op == 'contains':
-                condition = "p.practice_type LIKE ?"
-                params.append(f"%{value}%")
-        
-        # Industry queries
-        elif field == 'industry':
-            joins.add('industries')
-            if op == 'eq':
-                condition = "ind.industry = ?"
-                params.append(value)
-            elif op == 'contains':
-                condition = "ind.industry LIKE ?"
-                params.append(f"%{value}%")
-        
-        # Region queries
-        elif field == 'region':
-            joins.add('regions')
-            if op == 'eq':
-                condition = "r.region = ?"
-                params.append(value)
-            elif op == 'contains':
-                condition = "r.region LIKE ?"
-                params.append(f"%{value}%")
-        
-        # Language queries
-        elif field == 'language':
-            joins.add('languages')
-            if op == 'eq':
-                # Use case-insensitive matching for languages
-                condition = "LOWER(lang.language) = LOWER(?)"
-                params.append(value)
-            elif op == 'contains':
-                # Use case-insensitive LIKE matching
-                condition = "LOWER(lang.language) LIKE LOWER(?)"
-                params.append(f"%{value}%")
+        compile_field = _FIELD_COMPILERS.get(field)
+        if compile_field is None:
+            continue
+        condition = compile_field(node, conn, joins, fts_joins, params)
         
         if condition:
             # Add AND before condition if not the first one and no explicit operator
-            if not is_first_condition and where_parts and where_parts[-1] not in ['AND', 'OR', 'NOT']:
+            if not is_first_condition and where_parts and where_parts[-1] not in ('AND', 'OR', 'NOT'):
                 where_parts.append('AND')
             where_parts.append(condition)
             is_first_condition = False
-        
-        i += 1
     
+    sql = _assemble_sql(frozenset(joins), 'lawyers_fts' in fts_joins, tuple(where_parts))
+    
+    return sql, params
+
+
+@functools.lru_cache(maxsize=256)
+def _assemble_sql(joins: frozenset, use_fts: bool, where_parts: Tuple[str, ...]) -> str:
+    """
+    Assemble the final SQL string from the compiled query parts.
+    
+    The parts depend only on the shape of the AST (fields, ops and operators),
+    never on filter values, so repeated searches reuse the cached string.
+    
+    Args:
+        joins: Child tables to LEFT JOIN
+        use_fts: Whether to join lawyers_fts
+        where_parts: WHERE conditions and boolean operators, in order
+        
+    Returns:
+        SQL query string
+    """
     # Build JOIN clauses
     join_clauses = []
-    if 'lawyers_fts' in fts_joins:
+    if use_fts:
         # FTS5 join - use INNER JOIN for better performance with MATCH queries
         join_clauses.append("INNER JOIN lawyers_fts fts ON l.id = fts.rowid")
-    if 'educations' in joins:
-        join_clauses.append("LEFT JOIN educations e ON l.id = e.lawyer_id")
-    if 'practices' in joins:
-        join_clauses.append("LEFT JOIN practices p ON l.id = p.lawyer_id")
-    if 'industries' in joins:
-        join_clauses.append("LEFT JOIN industries ind ON l.id = ind.lawyer_id")
-    if 'regions' in joins:
-        join_clauses.append("LEFT JOIN regions r ON l.id = r.lawyer_id")
-    if 'languages' in joins:
-        join_clauses.append("LEFT JOIN languages lang ON l.id = lang.lawyer_id")
+    join_clauses.extend(clause for table, clause in _JOIN_CLAUSES if table in joins)
     
     # Build final SQL
-    sql = "SELECT DISTINCT l.id, l.name, l.url FROM lawyers l"
+    # Only the LEFT JOINs can repeat a lawyer row (the FTS5 join is 1-to-1 on rowid),
+    # so skip the DISTINCT sort/hash when there are none
+    if joins:
+        sql = "SELECT DISTINCT l.id, l.name, l.url FROM lawyers l"
+    else:
+        sql = "SELECT l.id, l.name, l.url FROM lawyers l"
     
     if join_clauses:
         sql += " " + " ".join(join_clauses)
@@ -218,7 +303,7 @@ def compile_ast_to_sql(ast: List[Dict[str, Any]], conn: sqlite3.Connection) -> T
     
     sql += " ORDER BY l.name"
     
-    return sql, params
+    return sql
 
 
 def execute_query(conn: sqlite3.Connection, sql: str, params: List[Any], 
@@ -235,19 +320,26 @@ def execute_query(conn: sqlite3.Connection, sql: str, params: List[Any],
     Returns:
         List of result dictionaries with id, name, url
     """
+    # Bind the limit so every page size shares one cached statement
     if limit:
-        sql += f" LIMIT {limit}"
+        sql += " LIMIT ?"
+        params = list(params) + [int(limit)]
     
+    # The SQL text depends only on the AST shape, so repeated searches reuse the
+    # connection's cached prepared statement and only rebind parameters
     cursor = conn.cursor()
+    # Plain tuples instead of the connection's sqlite3.Row factory; only this
+    # cursor is affected, so explain_query and other callers still get Rows
+    cursor.row_factory = None
+    cursor.arraysize = 1024
     cursor.execute(sql, params)
     
+    # Fetch in batches and unpack the (id, name, url) tuples
     results = []
-    for row in cursor:
-        results.append({
-            'id': row['id'],
-            'name': row['name'],
-            'url': row['url']
-        })
+    rows = cursor.fetchmany()
+    while rows:
+        results.extend({'id': lawyer_id, 'name': name, 'url': url} for lawyer_id, name, url in rows)
+        rows = cursor.fetchmany()
     
     return results
 
@@ -2,15 +2,26 @@
 Semantic search module for finding lawyers based on experience similarity.
 """
 
+import math
+import os
 import sqlite3
 import numpy as np
-import pickle
+from collections import OrderedDict
 from typing import List, Tuple, Dict, Any
-from database import init_database
+from database import init_database, embedding_from_blob
 from llm_utils import get_embedding, EMBEDDING_MODEL_SMALL
 from embedding_generator import load_embedding
 
 
+# In-memory embedding index per database file:
+# abspath -> (file signature, lawyer_ids, unit-normalized embedding matrix)
+_embedding_index_cache = {}
+
+# LRU cache of query embeddings keyed by query text
+_query_embedding_cache = OrderedDict()
+_QUERY_EMBEDDING_CACHE_SIZE = 256
+
+
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """
     Calculate cosine similarity between two vectors.
@@ -22,19 +33,16 @@ def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     Returns:
         Cosine similarity score between -1 and 1
     """
-    # Ensure vectors are 1D
-    a = a.flatten()
-    b = b.flatten()
-    
-    # Calculate cosine similarity
-    dot_product = np.dot(a, b)
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
+    # np.vdot flattens its inputs itself, so no 1D copies are needed, and
+    # squared norms via vdot skip np.linalg.norm's dispatch overhead
+    dot_product = np.vdot(a, b)
+    norm_sq_a = np.vdot(a, a)
+    norm_sq_b = np.vdot(b, b)
     
-    if norm_a == 0 or norm_b == 0:
+    if norm_sq_a == 0 or norm_sq_b == 0:
         return 0.0
     
-    return dot_product / (norm_a * norm_b)
+    return float(dot_product / math.sqrt(float(norm_sq_a) * float(norm_sq_b)))
 
 
 def check_embeddings_exist(db_path: str = 'lawyers.db') -> Tuple[bool, int]:
@@ -70,6 +78,82 @@ def semantic_search(query: str, k: int = 50, db_path: str = 'lawyers.db') -> Lis
     Returns:
         List of (lawyer_id, similarity_score) tuples, sorted by relevance
         
+    Raises:
+        ValueError: If no embeddings exist in the database
+    """
+    # Load the index first so a missing index fails before the embedding API call
+    lawyer_ids, embeddings = _load_search_index(db_path)
+    
+    # Generate embedding for the query (cached for repeated queries)
+    query_embedding = get_query_embeddings([query])[0]
+    
+    return _rank_lawyers(lawyer_ids, embeddings, query_embedding, k)
+
+
+def semantic_search_by_embedding(query_embedding: np.ndarray, k: int = 50,
+                                 db_path: str = 'lawyers.db') -> List[Tuple[int, float]]:
+    """
+    Perform semantic search with a query embedding that was already computed,
+    e.g. by get_query_embeddings for a batch of queries.
+    
+    Args:
+        query_embedding: Embedding vector of the search query
+        k: Number of top results to return
+        db_path: Path to the database
+        
+    Returns:
+        List of (lawyer_id, similarity_score) tuples, sorted by relevance
+        
+    Raises:
+        ValueError: If no embeddings exist in the database
+    """
+    lawyer_ids, embeddings = _load_search_index(db_path)
+    return _rank_lawyers(lawyer_ids, embeddings, query_embedding, k)
+
+
+def get_query_embeddings(queries: List[str]) -> List[np.ndarray]:
+    """
+    Embed search queries, sending all uncached queries in a single API call.
+    
+    Results are kept in an LRU cache so repeated queries skip the API call.
+    
+    Args:
+        queries: The search queries
+        
+    Returns:
+        Read-only float32 embedding vector for each query, in order
+    """
+    missing = [query for query in dict.fromkeys(queries) if query not in _query_embedding_cache]
+    if missing:
+        vectors = get_embedding(missing, size=EMBEDDING_MODEL_SMALL)
+        if len(vectors) != len(missing):
+            raise ValueError(f"Expected {len(missing)} query embeddings, got {len(vectors)}")
+        for query, vector in zip(missing, vectors):
+            query_embedding = np.array(vector, dtype=np.float32)
+            query_embedding.flags.writeable = False
+            _query_embedding_cache[query] = query_embedding
+    
+    results = []
+    for query in queries:
+        _query_embedding_cache.move_to_end(query)
+        results.append(_query_embedding_cache[query])
+    
+    while len(_query_embedding_cache) > _QUERY_EMBEDDING_CACHE_SIZE:
+        _query_embedding_cache.popitem(last=False)
+    
+    return results
+
+
+def _load_search_index(db_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the embedding index for a database, checking that embeddings exist.
+    
+    Args:
+        db_path: Path to the database
+        
+    Returns:
+        Tuple of (lawyer_ids, embeddings) as returned by _get_embedding_index
+        
     Raises:
         ValueError: If no embeddings exist in the database
     """
@@ -88,37 +172,133 @@ def semantic_search(query: str, k: int = 50, db_path: str = 'lawyers.db') -> Lis
             "  python main.py --generate-embeddings"
         )
     
-    # Generate embedding for the query
-    query_embedding = get_embedding([query], size=EMBEDDING_MODEL_SMALL)[0]
-    query_embedding = np.array(query_embedding, dtype=np.float32)
-    
     # Get all lawyers with embeddings
+    lawyer_ids, embeddings = _get_embedding_index(conn, db_path)
+    
+    conn.close()
+    return lawyer_ids, embeddings
+
+
+def _rank_lawyers(lawyer_ids: np.ndarray, embeddings: np.ndarray, query_embedding: np.ndarray,
+                  k: int) -> List[Tuple[int, float]]:
+    """
+    Rank lawyers by cosine similarity between their embeddings and the query.
+    
+    Args:
+        lawyer_ids: Lawyer id of each embedding row
+        embeddings: Unit-length embedding matrix
+        query_embedding: Embedding vector of the search query
+        k: Number of top results to return
+        
+    Returns:
+        List of (lawyer_id, similarity_score) tuples, sorted by relevance
+    """
+    # Cosine similarity against every lawyer at once: the rows are unit length,
+    # so a single matrix-vector product replaces the per-lawyer dot and norms.
+    # Both operands must be contiguous float32 for this to be one (multithreaded)
+    # BLAS sgemv; a float64 query would upcast a copy of the whole matrix.
+    query_embedding = np.ascontiguousarray(query_embedding, dtype=np.float32)
+    query_norm = np.linalg.norm(query_embedding)
+    if query_norm == 0 or len(lawyer_ids) == 0:
+        scores = np.zeros(len(lawyer_ids), dtype=np.float32)
+    else:
+        scores = embeddings @ (query_embedding / query_norm)
+    
+    # Select the top k without sorting every score, then order just those
+    # (by similarity descending, ties by row order as a stable sort would)
+    if 0 < k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+    else:
+        top = np.argsort(-scores, kind='stable')[:k]
+    return [(int(lawyer_ids[i]), float(scores[i])) for i in top]
+
+
+def _db_signature(db_path: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    Return (mtime_ns, size) of the database file and its WAL file, if any.
+    
+    Any committed write changes one of them, so a matching signature means the
+    stored embeddings are unchanged.
+    """
+    signature = []
+    for path in (db_path, db_path + '-wal'):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _get_embedding_index(conn: sqlite3.Connection, db_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the lawyer_ids and embedding matrix for a database, loading them only
+    when the database file has changed since the last call.
+    
+    Args:
+        conn: Database connection
+        db_path: Path to the database
+        
+    Returns:
+        Tuple of (lawyer_ids, embeddings) as returned by _load_embedding_matrix
+    """
+    key = os.path.abspath(db_path)
+    signature = _db_signature(key)
+    
+    cached = _embedding_index_cache.get(key)
+    if cached and cached[0] == signature:
+        return cached[1], cached[2]
+    
+    # Plain tuples fetched in large batches; the join only drops embeddings
+    # whose lawyer no longer exists
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.arraysize = 4096
     cursor.execute('''
-        SELECT ee.lawyer_id, ee.embedding, l.name
+        SELECT ee.lawyer_id, ee.embedding
         FROM experience_embeddings ee
         JOIN lawyers l ON ee.lawyer_id = l.id
     ''')
+    lawyer_ids, embeddings = _load_embedding_matrix(cursor)
     
-    results = []
+    # Shared across searches, so guard against accidental in-place edits
+    lawyer_ids.flags.writeable = False
+    embeddings.flags.writeable = False
+    _embedding_index_cache[key] = (signature, lawyer_ids, embeddings)
+    
+    return lawyer_ids, embeddings
+
+
+def _load_embedding_matrix(cursor: sqlite3.Cursor) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load embeddings from an executed (lawyer_id, embedding) query into one matrix.
     
-    for row in cursor:
-        lawyer_id = row['lawyer_id']
-        embedding_blob = row['embedding']
+    Args:
+        cursor: Cursor over the embedding rows as tuples
         
-        if embedding_blob:
-            # Load embedding
-            lawyer_embedding = pickle.loads(embedding_blob)
-            
-            # Calculate similarity
-            similarity = cosine_similarity(query_embedding, lawyer_embedding)
-            
-            results.append((lawyer_id, similarity))
+    Returns:
+        Tuple of (lawyer_ids, embeddings), where embeddings is a contiguous
+        float32 array with one unit-length row per lawyer (zero vectors stay zero)
+    """
+    lawyer_ids = []
+    vectors = []
+    rows = cursor.fetchmany()
+    while rows:
+        for lawyer_id, blob in rows:
+            if blob:
+                lawyer_ids.append(lawyer_id)
+                vectors.append(embedding_from_blob(blob))
+        rows = cursor.fetchmany()
     
-    conn.close()
+    if not vectors:
+        return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)
     
-    # Sort by similarity (descending) and return top k
-    results.sort(key=lambda x: x[1], reverse=True)
-    return results[:k]
+    # Stored embeddings are already unit length (see embedding_to_blob);
+    # vstack yields the C-contiguous layout BLAS expects
+    embeddings = np.vstack(vectors).astype(np.float32, copy=False)
+    
+    return np.array(lawyer_ids, dtype=np.int64), embeddings
 
 
 def get_lawyer_experience_preview(lawyer_id: int, db_path: str = 'lawyers.db') -> Dict[str, Any]:
@@ -132,33 +312,56 @@ def get_lawyer_experience_preview(lawyer_id: int, db_path: str = 'lawyers.db') -
     Returns:
         Dictionary with lawyer info and experience preview
     """
+    return get_lawyer_experience_previews([lawyer_id], db_path).get(lawyer_id)
+
+
+def get_lawyer_experience_previews(lawyer_ids: List[int],
+                                   db_path: str = 'lawyers.db') -> Dict[int, Dict[str, Any]]:
+    """
+    Get experience previews for several lawyers with one query per batch of ids.
+    
+    Args:
+        lawyer_ids: IDs of the lawyers
+        db_path: Path to the database
+        
+    Returns:
+        Dictionary mapping each found lawyer_id to its preview
+        (see get_lawyer_experience_preview)
+    """
     conn = init_database(db_path)
     cursor = conn.cursor()
     
-    cursor.execute('''
-        SELECT l.name, l.url, ee.content
-        FROM lawyers l
-        LEFT JOIN experience_embeddings ee ON l.id = ee.lawyer_id
-        WHERE l.id = ?
-    ''', (lawyer_id,))
-    
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        content = row['content'] or 'No experience data'
-        # Truncate content for preview
-        if len(content) > 200:
-            content = content[:200] + '...'
+    previews = {}
+    unique_ids = list(dict.fromkeys(lawyer_ids))
+    # Batched to stay under SQLite's bound-parameter limit
+    for i in range(0, len(unique_ids), 500):
+        batch = unique_ids[i:i + 500]
+        placeholders = ', '.join('?' * len(batch))
+        cursor.execute(f'''
+            SELECT l.id, l.name, l.url, ee.content
+            FROM lawyers l
+            LEFT JOIN experience_embeddings ee ON l.id = ee.lawyer_id
+            WHERE l.id IN ({placeholders})
+        ''', batch)
+        
+        for row in cursor.fetchall():
+            if row['id'] in previews:
+                continue
+            
+            content = row['content'] or 'No experience data'
+            # Truncate content for preview
+            if len(content) > 200:
+                content = content[:200] + '...'
             
-        return {
-            'id': lawyer_id,
-            'name': row['name'],
-            'url': row['url'],
-            'experience_preview': content
-        }
+            previews[row['id']] = {
+                'id': row['id'],
+                'name': row['name'],
+                'url': row['url'],
+                'experience_preview': content
+            }
     
-    return None
+    conn.close()
+    return previews
 
 
 def explain_search_results(query: str, results: List[Tuple[int, float]], 
@@ -175,8 +378,10 @@ def explain_search_results(query: str, results: List[Tuple[int, float]],
     print(f"\nSemantic Search Results for: '{query}'")
     print("=" * 80)
     
+    previews = get_lawyer_experience_previews([lawyer_id for lawyer_id, _ in results[:top_n]], db_path)
+    
     for i, (lawyer_id, score) in enumerate(results[:top_n]):
-        info = get_lawyer_experience_preview(lawyer_id, db_path)
+        info = previews.get(lawyer_id)
         if info:
             print(f"\n{i+1}. {info['name']} (Score: {score:.4f})")
             print(f"   URL: {info['url']}")
@@ -198,6 +403,12 @@ if __name__ == '__main__':
     print("Testing Semantic Search")
     print("-" * 80)
     
+    # Embed all test queries in one API call; the searches below hit the cache
+    try:
+        get_query_embeddings(test_queries)
+    except Exception as e:
+        print(f"Error embedding test queries: {e}")
+    
     for query in test_queries:
         print(f"\nQuery: {query}")
         
@@ -208,8 +419,9 @@ if __name__ == '__main__':
             if results:
                 print(f"Found {len(results)} results")
                 # Show top 3
+                previews = get_lawyer_experience_previews([lawyer_id for lawyer_id, _ in results[:3]])
                 for i, (lawyer_id, score) in enumerate(results[:3]):
-                    info = get_lawyer_experience_preview(lawyer_id)
+                    info = previews.get(lawyer_id)
                     if info:
                         print(f"  {i+1}. {info['name']} (Score: {score:.4f})")
             else: